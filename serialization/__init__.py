@@ -11,10 +11,12 @@ from .serialization import (
     DataclassSerializer,
     ObjectSerializer,
     Namespace,
+    FrozenNamespace,
     SerializationEncoder,
     serialize_object,
     to_namespace,
     serialize,
+    dumps,
 )
 
 __version__ = "1.0.0"
@@ -26,8 +28,10 @@ __all__ = [
     "DataclassSerializer",
     "ObjectSerializer",
     "Namespace",
+    "FrozenNamespace",
     "SerializationEncoder",
     "serialize_object",
     "to_namespace",
     "serialize",
+    "dumps",
 ]
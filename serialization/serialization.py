@@ -8,9 +8,19 @@ of dataclass serialization, rich object serialization, and namespace handling.
 
 from abc import ABC, abstractmethod
 from dataclasses import is_dataclass, fields
+from functools import lru_cache, partial
 from types import SimpleNamespace
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List, Optional
 import json
+import sys
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+else:
+    if not hasattr(orjson, "OPT_PASSTHROUGH_DATETIME"):  # pragma: no cover
+        orjson = None  # too old for the options used below
 
 
 __all__ = [
@@ -18,15 +28,19 @@ __all__ = [
     "DataclassSerializer",
     "ObjectSerializer",
     "Namespace",
+    "FrozenNamespace",
     "SerializationEncoder",
     "serialize_object",
     "to_namespace",
+    "dumps",
 ]
 
 
 class SerializationMixin(ABC):
     """Base mixin providing common serialization functionality."""
 
+    __slots__ = ()
+
     @abstractmethod
     def serialize(self, **kwargs) -> Dict[str, Any]:
         """Serialize the object to a dictionary."""
@@ -34,14 +48,140 @@ class SerializationMixin(ABC):
 
     def to_dict(self, **kwargs) -> Dict[str, Any]:
         """Alias for serialize() returning a dict."""
-        result = self.serialize(**kwargs)
-        return dict(result) if hasattr(result, "items") else result
+        return self.serialize(**kwargs)
 
     def to_json(self, indent=None, **kwargs) -> str:
-        """Serialize to JSON string."""
-        return json.dumps(
-            self.serialize(**kwargs), cls=SerializationEncoder, indent=indent
-        )
+        """Serialize to JSON string.
+
+        Uses orjson when it is installed, unless an indent other than 2 is
+        requested (orjson only supports 2-space indentation).
+        """
+        return _dumps(self.serialize(**kwargs), indent)
+
+
+# Value traits, classified once per type and cached by type(value)
+_RESOLVED = 1
+_HAS_SERIALIZE = 2
+_HAS_DICT = 4
+_HAS_SLOTS = 8
+_IS_DICT = 16
+_IS_LIST = 32
+_IS_DATACLASS = 64
+
+_TYPE_TRAITS: Dict[type, int] = {}
+
+# Bound on the per-type caches, which are cleared once full (as re does) so
+# that dynamically created classes are not kept alive for good
+_MAX_CACHED_TYPES = 1024
+
+# Types that are never serialized further
+_PRIMITIVE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _resolve_traits(value) -> int:
+    """Classify type(value) and cache the result in _TYPE_TRAITS.
+
+    Classes passed as values share type(value) with every other class, so
+    they are classified individually and never cached.
+    """
+    traits = _RESOLVED
+    if hasattr(type(value), "serialize"):
+        traits |= _HAS_SERIALIZE
+    if hasattr(value, "__dict__"):
+        traits |= _HAS_DICT
+    if hasattr(value, "__slots__"):
+        traits |= _HAS_SLOTS
+    if isinstance(value, dict):
+        traits |= _IS_DICT
+    if isinstance(value, list):
+        traits |= _IS_LIST
+    if hasattr(value if isinstance(value, type) else type(value), "__dataclass_fields__"):
+        traits |= _IS_DATACLASS
+    if not isinstance(value, type):
+        if len(_TYPE_TRAITS) >= _MAX_CACHED_TYPES:
+            _TYPE_TRAITS.clear()
+        _TYPE_TRAITS[type(value)] = traits
+    return traits
+
+
+def _has_ser(value) -> bool:
+    """Return True if value provides a serialize() method."""
+    traits = _TYPE_TRAITS.get(type(value)) or _resolve_traits(value)
+    return traits & _HAS_SERIALIZE != 0
+
+
+def _is_dc(value) -> bool:
+    """Return True if value is a dataclass (or dataclass instance)."""
+    traits = _TYPE_TRAITS.get(type(value)) or _resolve_traits(value)
+    return traits & _IS_DATACLASS != 0
+
+
+# Dataclass fields by type, avoiding fields() rebuilding the tuple per call.
+# A plain dict like _TYPE_TRAITS: a WeakKeyDictionary would build a weakref
+# on every lookup in this hot path.
+_DC_FIELDS_CACHE: Dict[type, tuple] = {}
+
+
+def _dc_fields(value) -> tuple:
+    """Return fields() for a dataclass instance, cached by its type."""
+    # A dataclass class (whose type is never cached) falls through to fields()
+    cached = _DC_FIELDS_CACHE.get(type(value))
+    if cached is None:
+        if isinstance(value, type):
+            return fields(value)
+        if len(_DC_FIELDS_CACHE) >= _MAX_CACHED_TYPES:
+            _DC_FIELDS_CACHE.clear()
+        _DC_FIELDS_CACHE[type(value)] = cached = fields(value)
+    return cached
+
+
+def _serialize_nested(value, kwargs):
+    """Serialize a non-None DataclassSerializer field value for nested output."""
+    if _has_ser(value):
+        return value.serialize(nested=True, **kwargs)
+    elif _is_dc(value):
+        # Convert dataclass to dict recursively
+        return {
+            f.name: v
+            for f in _dc_fields(value)
+            if (v := getattr(value, f.name)) is not None
+        }
+    elif isinstance(value, list):
+        # Handle lists of serializable objects
+        return _serialize_list(value, kwargs)
+    return value
+
+
+def _serialize_list(items: list, kwargs) -> list:
+    """Serialize list items, calling serialize() on those that provide it."""
+    if not items:
+        return []
+    # Classify the first item; items of the same type need no further probes
+    first = items[0]
+    first_type = type(first)
+    traits = _TYPE_TRAITS.get(first_type) or _resolve_traits(first)
+    if traits & _HAS_SERIALIZE:
+        if first_type.serialize is Namespace.serialize:
+            # Plain namespaces: serialize their attributes without the method call
+            attr_kwargs = dict(kwargs)
+            recursive = attr_kwargs.pop("recursive", True)
+            return [
+                _serialize_attrs(item.__dict__, recursive, attr_kwargs)
+                if type(item) is first_type
+                else item.serialize(**kwargs)
+                if _has_ser(item)
+                else item
+                for item in items
+            ]
+        return [
+            item.serialize(**kwargs)
+            if type(item) is first_type or _has_ser(item)
+            else item
+            for item in items
+        ]
+    elif first_type in _PRIMITIVE_TYPES and _PRIMITIVE_TYPES.issuperset(map(type, items)):
+        return list(items)
+    return [item.serialize(**kwargs) if _has_ser(item) else item for item in items]
 
 
 class DataclassSerializer(SerializationMixin):
@@ -49,75 +189,277 @@ class DataclassSerializer(SerializationMixin):
 
     # Class-level configuration - override in subclasses
     _field_map: Dict[str, str] = {}  # field_name -> serialized_name
-    _exclude_fields: set = set()  # fields to exclude
+    _exclude_fields: frozenset = frozenset()  # fields to exclude
     _default_values: Dict[str, Any] = {}  # default values for missing fields
 
+    __slots__ = ()
+
+    # value_of_<field> transformer method names by field name, per subclass
+    _transformers: Dict[str, str] = {}
+    # Per-class field plan and generated serialize function, built on first use
+    _serialize_plan: Optional[tuple] = None
+    _serializer: Optional[Callable] = None
+
     def __init_subclass__(cls, **kwargs):
-        """Initialize a subclass with empty configurations if not defined."""
+        """Normalize a subclass configuration, filling in empty defaults.
+
+        Each subclass gets its own copy of the configuration, with the
+        exclusions frozen, since it is compiled into the cached serialization
+        plan on first use and later changes would not take effect.
+        """
         super().__init_subclass__(**kwargs)
-        if not hasattr(cls, "_field_map"):
-            cls._field_map = {}
-        if not hasattr(cls, "_exclude_fields"):
-            cls._exclude_fields = set()
-        if not hasattr(cls, "_default_values"):
-            cls._default_values = {}
+        cls._field_map = {
+            name: sys.intern(key) if type(key) is str else key
+            for name, key in getattr(cls, "_field_map", {}).items()
+        }
+        cls._exclude_fields = frozenset(getattr(cls, "_exclude_fields", ()))
+        cls._default_values = dict(getattr(cls, "_default_values", {}))
+        # Looked up as names so static and class methods bind as usual
+        cls._transformers = {
+            name[len("value_of_") :]: name
+            for name in dir(cls)
+            if name.startswith("value_of_") and callable(getattr(cls, name))
+        }
+        # The plan needs the dataclass fields, which @dataclass only adds after
+        # the class is created, so it is compiled on the first serialize()
+        cls._serialize_plan = None
+        cls._serializer = None
 
     def serialize(self, nested=True, **kwargs) -> Dict[str, Any]:
         """Serialize dataclass with field mapping."""
-        if not is_dataclass(self):
-            raise ValueError("DataclassSerializer can only be used with dataclasses")
+        serializer = type(self)._serializer
+        if serializer is None:
+            serializer = self._compile_serializer()
+        return serializer(self, nested, kwargs)
 
-        result = {}
-        for field in fields(self):
-            if field.name in self._exclude_fields:
-                continue
+    @classmethod
+    def serialize_many(cls, objs, nested=True, **kwargs) -> List[Dict[str, Any]]:
+        """Serialize an iterable of instances into a list of dictionaries.
 
-            # Get value with a custom transformer if available
-            value = self._get_field_value(field.name)
-            if value is None:
+        The class serializer is resolved once for the whole batch; objects of
+        other classes (or of classes overriding serialize) use their own
+        serialize().
+        """
+        serializer = None
+        if cls.serialize is DataclassSerializer.serialize and is_dataclass(cls):
+            serializer = cls._serializer or cls._compile_serializer()
+        return [
+            serializer(obj, nested, kwargs)
+            if type(obj) is cls and serializer is not None
+            else obj.serialize(nested=nested, **kwargs)
+            for obj in objs
+        ]
+
+    def to_json_fast(self) -> str:
+        """Serialize to JSON in a single orjson pass.
+
+        Nested values are not serialized into an intermediate dict first:
+        each dataclass is serialized shallowly and orjson encodes the fields,
+        calling back only for the objects it cannot encode itself. The output
+        matches to_json(), which is used instead when orjson is not installed;
+        values orjson rejects are encoded as in to_json() (see _dumps).
+        """
+        if orjson is None:
+            return self.to_json()
+        try:
+            return orjson.dumps(
+                self, default=_orjson_shallow_default, option=_ORJSON_OPTIONS
+            ).decode()
+        except orjson.JSONEncodeError:
+            return _dumps_fallback(self.serialize())
+
+    @classmethod
+    def _build_plan(cls) -> tuple:
+        """Resolve and cache the serialization plan for the class.
+
+        The plan holds (field_name, serialized_key, transformer_name, default) for
+        each included field. Configuration is read once, on the first
+        serialize() of each class.
+        """
+        if not is_dataclass(cls):
+            raise ValueError("DataclassSerializer can only be used with dataclasses")
+
+        plan = []
+        for f in fields(cls):
+            if f.name in cls._exclude_fields:
                 continue
+            plan.append(
+                (
+                    f.name,
+                    cls._field_map.get(f.name, sys.intern(f.name)),
+                    cls._transformers.get(f.name),
+                    cls._default_values.get(f.name),
+                )
+            )
+        cls._serialize_plan = plan = tuple(plan)
+        return plan
 
-            # Handle nested serialization
-            if hasattr(value, "serialize") and nested:
-                value = value.serialize(nested=nested, **kwargs)
-            elif is_dataclass(value) and nested:
-                # Convert dataclass to dict recursively
-                value = {
-                    f.name: getattr(value, f.name)
-                    for f in fields(value)
-                    if getattr(value, f.name) is not None
-                }
-            elif isinstance(value, list) and nested:
-                # Handle lists of serializable objects
-                value = [
-                    item.serialize(**kwargs) if hasattr(item, "serialize") else item
-                    for item in value
-                ]
+    @classmethod
+    def _compile_serializer(cls):
+        """Generate and cache a straight-line serialize function for the class.
 
-            # Apply field name mapping
-            key = self._field_map.get(field.name, field.name)
-            result[key] = value
+        The function body reads each planned field by name, so serializing an
+        instance involves no field iteration or configuration lookups.
+        """
+        plan = cls._serialize_plan
+        if plan is None:
+            plan = cls._build_plan()
+        namespace = {"_serialize_nested": _serialize_nested}
+        lines = ["def serialize(self, nested, kwargs):", "    result = {}"]
+        for index, (name, key, transformer, default) in enumerate(plan):
+            if default is None:
+                lines.append(f"    value = getattr(self, {name!r}, None)")
+            else:
+                namespace[f"_default_{index}"] = default
+                lines.append(f"    value = getattr(self, {name!r}, _default_{index})")
+            if transformer is not None:
+                lines.append(f"    value = self.{transformer}(value)")
+            # The key object itself, not a literal: it is interned, or may
+            # not be a str at all
+            namespace[f"_key_{index}"] = key
+            lines.append("    if value is not None:")
+            lines.append(
+                f"        result[_key_{index}] = "
+                "_serialize_nested(value, kwargs) if nested else value"
+            )
+        lines.append("    return result")
 
-        return result
+        exec("\n".join(lines), namespace)
+        cls._serializer = serializer = namespace["serialize"]
+        return serializer
 
     def _get_field_value(self, field_name: str) -> Any:
         """Get field value, with support for custom value transformers."""
-        # Check for custom value transformer method
-        transformer_name = f"value_of_{field_name}"
-        if hasattr(self, transformer_name):
-            transformer = getattr(self, transformer_name)
-            if callable(transformer):
-                raw_value = getattr(
-                    self, field_name, self._default_values.get(field_name)
-                )
-                return transformer(raw_value)
+        value = getattr(self, field_name, self._default_values.get(field_name))
+        transformer = type(self)._transformers.get(field_name)
+        if transformer is not None:
+            return getattr(self, transformer)(value)
+        return value
+
+
+def _select_attribute(key: str, value: Any, with_id: bool = True) -> bool:
+    """Default ObjectSerializer attribute selection logic."""
+    # Cheapest checks first; callable() probes the value's type
+    return (
+        value is not None
+        and not key.startswith("_")
+        and (with_id or key != "id")
+        and not callable(value)
+    )
+
+
+def _identity(value: str) -> str:
+    return value
+
+
+# Key case transforms; other case values leave keys to the capital option
+_CASE_FNS = {"upper": str.upper, "lower": str.lower}
+
+
+class SerializeOptions:
+    """ObjectSerializer.serialize() options, resolved once and shared down a call tree."""
+
+    __slots__ = (
+        "flatten",
+        "with_id",
+        "with_class",
+        "case",
+        "capital",
+        "select_fn",
+        "field_prefix",
+        "extra",
+        "separator",
+        "case_fn",
+        "class_case_fn",
+        "label_key",
+        "_nested",
+    )
+
+    def __init__(
+        self,
+        flatten=True,
+        with_id=True,
+        with_class=False,
+        case=None,
+        capital=True,
+        select_fn=None,
+        field_prefix=None,
+        extra=None,
+    ):
+        self.flatten = flatten
+        self.with_id = with_id
+        self.with_class = with_class
+        self.case = case
+        self.capital = capital
+        self.select_fn = select_fn
+        self.field_prefix = field_prefix
+        # Passed on to nested serialize() calls
+        self.extra = {} if extra is None else extra
+        separator = ""
+        if with_class:
+            separator = "_" if isinstance(with_class, bool) else str(with_class)
+        self.separator = separator
+        # Case handling resolved to plain functions once, not compared per key
+        capitalize = str.capitalize if capital else _identity
+        self.case_fn = _CASE_FNS.get(case, capitalize)
+        self.class_case_fn = capitalize if capital else _CASE_FNS.get(case, _identity)
+        # Keyed by separator as with_class=True == 1
+        self.label_key = (separator, case, capital, field_prefix)
+        self._nested = None
+
+    @property
+    def nested(self) -> "SerializeOptions":
+        """Options for nested objects, with only flatten and extra carried over.
 
-        return getattr(self, field_name, self._default_values.get(field_name))
+        Built on first use, as most calls never reach a nested object.
+        """
+        nested = self._nested
+        if nested is None:
+            plain = self.label_key == ("", None, True, None)
+            if plain and self.with_id and not self.select_fn:
+                return self
+            self._nested = nested = SerializeOptions(self.flatten, extra=self.extra)
+        return nested
+
+    @classmethod
+    def from_kwargs(cls, kwargs: Dict[str, Any]) -> "SerializeOptions":
+        """Build options from serialize() keyword arguments."""
+        options = {k: v for k, v in kwargs.items() if k in _OPTION_NAMES}
+        extra = {k: v for k, v in kwargs.items() if k not in _OPTION_NAMES}
+        return cls(**options, extra=extra)
+
+
+# The serialize() option names, leading the slots
+_OPTION_NAMES = frozenset(SerializeOptions.__slots__[:7])
+# Options for the default arguments, equal to them or to values behaving alike
+_DEFAULT_ARGS = (True, True, False, None, True, None, None)
+_DEFAULT_OPTIONS = SerializeOptions(*_DEFAULT_ARGS)
+# Options for repeated argument combinations without a select_fn, so no callables
+# are kept alive; typed as with_class=True differs from 1
+_serialize_options = lru_cache(maxsize=256, typed=True)(SerializeOptions)
+
+
+# Per-class ObjectSerializer cache bounds; classes seen with more attribute
+# layouts, names or option combinations (dynamic attributes) go uncached past them
+_MAX_CACHED_LAYOUTS = 256
+_MAX_CACHED_LABELS = 1024
+_MAX_LABEL_TABLES = 64
 
 
 class ObjectSerializer(SerializationMixin):
     """Rich object serialization with formatting options."""
 
+    # Formatted keys by formatting options, then attribute name
+    _label_cache: Dict[tuple, Dict[str, str]] = {}
+    # Public attribute names by instance attribute layout
+    _attr_cache: Dict[tuple, tuple] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        """Give each subclass its own key and attribute caches."""
+        super().__init_subclass__(**kwargs)
+        cls._label_cache = {}
+        cls._attr_cache = {}
+
     def serialize(
         self,
         flatten=True,
@@ -140,94 +482,240 @@ class ObjectSerializer(SerializationMixin):
             select_fn: Custom function to select which fields to include
             field_prefix: Prefix to add to field names
         """
+        args = (flatten, with_id, with_class, case, capital, select_fn, field_prefix)
+        if kwargs or select_fn is not None:
+            options = SerializeOptions(*args, kwargs)
+        elif args == _DEFAULT_ARGS:
+            options = _DEFAULT_OPTIONS
+        else:
+            try:
+                options = _serialize_options(*args)
+            except TypeError:  # unhashable option values
+                options = SerializeOptions(*args)
+        return self._serialize_impl(options)
 
-        select_fn = select_fn or self._default_select
+    def _serialize_impl(self, options: SerializeOptions) -> Dict[str, Any]:
+        """Serialize with already resolved options.
+
+        When flattening, nested objects using the default serialize() are
+        walked in place instead of being serialized recursively and merged;
+        keys and their order are unchanged. The objects to resume are kept on
+        a stack, created only once a nested object is reached.
+        """
+        flatten = options.flatten
+        # Nested output is merged under this object's field prefix only
+        prefix = f"{options.field_prefix}_" if options.field_prefix else ""
+        traits_get = _TYPE_TRAITS.get
+        primitives = _PRIMITIVE_TYPES
         result = {}
+        stack = None
+        obj, obj_options, key_prefix, with_id = self, options, "", options.with_id
+        names, attrs, select_fn, labels = _object_frame(self, options)
 
-        for name, value in self.__dict__.items():
-            if not select_fn(name, value, with_id=with_id):
-                continue
+        while True:
+            for name in names:
+                value = attrs[name]
+                value_type = type(value)
+                if select_fn is None:
+                    # Default selection inlined; private names are already excluded
+                    if value is None or (not with_id and name == "id"):
+                        continue
+                    if value_type not in primitives and callable(value):
+                        continue
+                elif not select_fn(name, value, with_id=with_id):
+                    continue
 
-            # Format the key name
-            key = self._format_key(
-                name,
-                with_class=with_class,
-                case=case,
-                capital=capital,
-                field_prefix=field_prefix,
-            )
+                # Handle nested objects
+                if value_type not in primitives:
+                    traits = traits_get(value_type) or _resolve_traits(value)
+                    if traits & _HAS_SERIALIZE:
+                        if value_type.serialize is ObjectSerializer.serialize:
+                            if flatten:
+                                # Continue with the nested object, then resume this one
+                                if stack is None:
+                                    stack = []
+                                elif len(stack) > sys.getrecursionlimit():
+                                    raise RecursionError(
+                                        "object nesting too deep to flatten"
+                                    )
+                                stack.append(
+                                    (
+                                        names,
+                                        attrs,
+                                        select_fn,
+                                        labels,
+                                        obj,
+                                        obj_options,
+                                        key_prefix,
+                                    )
+                                )
+                                obj, obj_options, key_prefix = (
+                                    value,
+                                    options.nested,
+                                    prefix,
+                                )
+                                names, attrs, select_fn, labels = _object_frame(
+                                    obj, obj_options
+                                )
+                                with_id = obj_options.with_id
+                                break
+                            # Pass the resolved options on instead of rebuilding them
+                            value = value._serialize_impl(options.nested)
+                        else:
+                            value = value.serialize(flatten=flatten, **options.extra)
+                        if flatten:
+                            # Flatten nested serialization into parent
+                            if isinstance(value, dict):
+                                # Add prefix to nested keys if specified
+                                if prefix:
+                                    for k, v in value.items():
+                                        result[prefix + k] = v
+                                else:
+                                    result.update(value)
+                            continue
+                    elif traits & _HAS_DICT:
+                        # Serialize arbitrary objects
+                        select = select_fn or _select_attribute
+                        value = {
+                            k: v
+                            for k, v in value.__dict__.items()
+                            if select(k, v, with_id=with_id)
+                        }
+                    elif traits & _HAS_SLOTS:
+                        # Handle slotted objects
+                        value = str(value)
 
-            # Handle nested objects
-            if hasattr(value, "serialize"):
-                if flatten:
-                    # Flatten nested serialization into parent
-                    nested = value.serialize(flatten=flatten, **kwargs)
-                    if isinstance(nested, dict):
-                        # Add prefix to nested keys if specified
-                        if field_prefix:
-                            nested = {f"{field_prefix}_{k}": v for k, v in nested.items()}
-                        result |= nested
-                    continue
+                # Format the key name
+                if labels is None:
+                    key = obj._label_impl(name, obj_options)
                 else:
-                    value = value.serialize(flatten=False, **kwargs)
-            elif hasattr(value, "__dict__"):
-                # Serialize arbitrary objects
-                value = {
-                    k: v
-                    for k, v in value.__dict__.items()
-                    if select_fn(k, v, with_id=with_id)
-                }
-            elif hasattr(value, "__slots__"):
-                # Handle slotted objects
-                value = str(value)
-
-            result[key] = value
+                    key = labels.get(name)
+                    if key is None:
+                        key = obj._label_impl(name, obj_options)
+                        if len(labels) < _MAX_CACHED_LABELS:
+                            labels[name] = key
+                if key_prefix:
+                    key = key_prefix + key
+                result[key] = value
+            else:
+                # Done with this object; resume its parent, if any
+                if not stack:
+                    return result
+                names, attrs, select_fn, labels, obj, obj_options, key_prefix = (
+                    stack.pop()
+                )
+                with_id = obj_options.with_id
 
-        return result
+    @classmethod
+    def serialize_many(cls, objs, **kwargs) -> List[Dict[str, Any]]:
+        """Serialize an iterable of objects with the same options."""
+        options = SerializeOptions.from_kwargs(kwargs)
+        default_serialize = ObjectSerializer.serialize
+        return [
+            obj._serialize_impl(options)
+            if type(obj).serialize is default_serialize
+            else obj.serialize(**kwargs)
+            for obj in objs
+        ]
 
     def _default_select(self, key: str, value: Any, with_id: bool = True) -> bool:
         """Default attribute selection logic."""
-        return (
-            not key.startswith("_")
-            and not callable(value)
-            and (with_id or key != "id")
-            and value is not None
-        )
+        return _select_attribute(key, value, with_id)
 
     def _format_key(
         self, key: str, with_class=False, case=None, capital=True, field_prefix=None
     ) -> str:
         """Format key names with various options."""
-        # Apply case transformation
-        if case == "upper":
-            key = key.upper()
-        elif case == "lower":
-            key = key.lower()
-        elif capital:
-            key = key.capitalize()
-
-        # Add field prefix
-        if field_prefix:
-            key = f"{field_prefix}_{key}"
-
-        # Add class prefix
-        if with_class:
-            class_name = self.__class__.__name__
-            if capital:
-                class_name = class_name.capitalize()
-            elif case == "upper":
-                class_name = class_name.upper()
-            elif case == "lower":
-                class_name = class_name.lower()
-
-            separator = "_" if isinstance(with_class, bool) else str(with_class)
-            key = f"{class_name}{separator}{key}"
-
-        return key
+        try:
+            return _format_key_cached(
+                self.__class__.__name__, key, with_class, case, capital, field_prefix
+            )
+        except TypeError:  # unhashable option values
+            options = SerializeOptions(
+                with_class=with_class,
+                case=case,
+                capital=capital,
+                field_prefix=field_prefix,
+            )
+            return _format_label(self.__class__.__name__, key, options)
 
     def label(self, name: str, **kwargs) -> str:
         """Legacy method for backward compatibility."""
-        return self._format_key(name, **kwargs)
+        return self._label_impl(name, SerializeOptions(**kwargs))
+
+    def _label_impl(self, name: str, options: SerializeOptions) -> str:
+        """Format a key name with already resolved options."""
+        if type(self)._format_key is not ObjectSerializer._format_key:
+            return self._format_key(
+                name,
+                with_class=options.with_class,
+                case=options.case,
+                capital=options.capital,
+                field_prefix=options.field_prefix,
+            )
+        return _format_label(self.__class__.__name__, name, options)
+
+
+def _object_frame(obj, options: SerializeOptions) -> tuple:
+    """Prepare an ObjectSerializer for the _serialize_impl() walk.
+
+    Returns (names, attrs, select_fn, labels): an iterator over the attribute
+    names to consider, the instance attributes, the selector to apply, or None
+    for the default selection with private names already excluded, and the
+    per-class formatted-key table, or None when the class overrides _format_key.
+    """
+    cls = type(obj)
+    attrs = obj.__dict__
+    select_fn = options.select_fn
+    if select_fn or cls._default_select is not ObjectSerializer._default_select:
+        names = tuple(attrs)
+        # Avoid binding a method per call unless a subclass overrides it
+        select_fn = select_fn or obj._default_select
+    else:
+        # Private names are filtered once per attribute layout, which is
+        # stable for most classes
+        layout = tuple(attrs)
+        names = cls._attr_cache.get(layout)
+        if names is None:
+            names = tuple(k for k in layout if not k.startswith("_"))
+            if len(cls._attr_cache) < _MAX_CACHED_LAYOUTS:
+                cls._attr_cache[layout] = names
+        select_fn = None
+    labels = None
+    if cls._format_key is ObjectSerializer._format_key:
+        labels = cls._label_cache.get(options.label_key)
+        if labels is None:
+            labels = {}
+            if len(cls._label_cache) < _MAX_LABEL_TABLES:
+                cls._label_cache[options.label_key] = labels
+    return iter(names), attrs, select_fn, labels
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _format_key_cached(
+    class_name: str, key: str, with_class, case, capital, field_prefix
+) -> str:
+    """Format an ObjectSerializer key; memoized as the inputs repeat across instances."""
+    options = SerializeOptions(
+        with_class=with_class, case=case, capital=capital, field_prefix=field_prefix
+    )
+    return _format_label(class_name, key, options)
+
+
+def _format_label(class_name: str, key: str, options: SerializeOptions) -> str:
+    """Format an ObjectSerializer key with resolved options."""
+    key = options.case_fn(key)
+
+    # Add field prefix
+    if options.field_prefix:
+        key = f"{options.field_prefix}_{key}"
+
+    # Add class prefix
+    if options.separator:
+        key = f"{options.class_case_fn(class_name)}{options.separator}{key}"
+
+    # Output keys repeat across every serialized instance; share one object
+    return sys.intern(key)
 
 
 class Namespace(SimpleNamespace, SerializationMixin):
@@ -235,24 +723,7 @@ class Namespace(SimpleNamespace, SerializationMixin):
 
     def serialize(self, recursive=True, **kwargs) -> Dict[str, Any]:
         """Serialize namespace to dictionary."""
-        result = {}
-        for key, value in self.__dict__.items():
-            if recursive and hasattr(value, "serialize"):
-                value = value.serialize(recursive=recursive, **kwargs)
-            elif recursive and isinstance(value, dict):
-                # Convert nested dicts to the proper serialized format
-                value = {
-                    k: v.serialize(**kwargs) if hasattr(v, "serialize") else v
-                    for k, v in value.items()
-                }
-            elif recursive and isinstance(value, list):
-                # Handle lists of serializable objects
-                value = [
-                    item.serialize(**kwargs) if hasattr(item, "serialize") else item
-                    for item in value
-                ]
-            result[key] = value
-        return result
+        return _serialize_attrs(self.__dict__, recursive, kwargs)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any], recursive=True):
@@ -261,23 +732,23 @@ class Namespace(SimpleNamespace, SerializationMixin):
             raise ValueError("data must be a dictionary")
 
         if not recursive:
-            return cls(**data)
-        # Convert nested dicts to Namespaces
-        processed_data = {}
-        for key, value in data.items():
-            if isinstance(value, dict):
-                processed_data[key] = cls.from_dict(value, recursive=True)
-            elif isinstance(value, list):
-                # Handle lists that might contain dicts
-                processed_data[key] = [
-                    cls.from_dict(item, recursive=True)
-                    if isinstance(item, dict)
-                    else item
-                    for item in value
-                ]
-            else:
-                processed_data[key] = value
-        return cls(**processed_data)
+            return cls._from_attrs(data)
+        if cls.__init__ is not SimpleNamespace.__init__:
+            return _build_from_dict(data, cls._from_attrs)
+        return _fill_from_dict(cls, data)
+
+    @classmethod
+    def _from_attrs(cls, attrs: Dict[str, Any]):
+        """Create an instance holding attrs, skipping SimpleNamespace.__init__.
+
+        Subclasses that define their own __init__ are constructed normally.
+        """
+        if cls.__init__ is not SimpleNamespace.__init__:
+            return cls(**attrs)
+        _check_keys(attrs)
+        ns = cls.__new__(cls)
+        ns.__dict__.update(attrs)
+        return ns
 
     def update(self, **kwargs):
         """Update the namespace with new values."""
@@ -290,38 +761,378 @@ class Namespace(SimpleNamespace, SerializationMixin):
         return getattr(self, key, default)
 
 
+class FrozenNamespace(SerializationMixin):
+    """Namespace with a fixed set of attributes stored in __slots__.
+
+    Each distinct set of keys gets a generated subclass declaring those keys
+    as slots, so instances carry no per-instance __dict__. Attributes can be
+    reassigned but not added or removed.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, **kwargs):
+        if "_frozen_keys" not in cls.__dict__:
+            cls = _frozen_namespace_class(cls, tuple(kwargs))
+        return object.__new__(cls)
+
+    def __init__(self, **kwargs):
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+    def _attrs(self) -> Dict[str, Any]:
+        return {key: getattr(self, key) for key in self._frozen_keys}
+
+    def serialize(self, recursive=True, **kwargs) -> Dict[str, Any]:
+        """Serialize namespace to dictionary."""
+        return _serialize_attrs(self._attrs(), recursive, kwargs)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], recursive=True):
+        """Create FrozenNamespace from a dictionary."""
+        if not isinstance(data, dict):
+            raise ValueError("data must be a dictionary")
+
+        if not recursive:
+            return cls._from_attrs(data)
+        return _build_from_dict(data, cls._from_attrs)
+
+    @classmethod
+    def _from_attrs(cls, attrs: Dict[str, Any]):
+        """Create an instance of the slotted subclass for the keys of attrs."""
+        ns = object.__new__(_frozen_namespace_class(cls, tuple(attrs)))
+        for key, value in attrs.items():
+            setattr(ns, key, value)
+        return ns
+
+    def update(self, **kwargs):
+        """Update existing attributes with new values."""
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+        return self
+
+    def get(self, key: str, default=None):
+        """Get attribute with default value."""
+        return getattr(self, key, default)
+
+    def __eq__(self, other):
+        if not isinstance(other, FrozenNamespace):
+            return NotImplemented
+        return self._attrs() == other._attrs()
+
+    __hash__ = None
+
+    def __repr__(self):
+        items = ", ".join(f"{k}={v!r}" for k, v in self._attrs().items())
+        return f"{self.__class__.__name__}({items})"
+
+    def __reduce__(self):
+        # Generated classes are not importable; rebuild through the base class
+        return type(self).__bases__[0]._from_attrs, (self._attrs(),)
+
+
+# Generated FrozenNamespace subclasses by (base class, key set), cleared when
+# full so that arbitrary key sets (untrusted JSON) do not keep classes alive
+_FROZEN_CLASSES: Dict[tuple, type] = {}
+_MAX_FROZEN_CLASSES = 512
+
+
+def _frozen_namespace_class(base: type, keys: tuple) -> type:
+    """Return the cached slotted subclass of base for keys, creating it once.
+
+    Classes are shared by key set: attributes keep the order of the keys the
+    class was created with.
+    """
+    schema = (base, frozenset(keys))
+    cls = _FROZEN_CLASSES.get(schema)
+    if cls is None:
+        for key in keys:
+            if (
+                not isinstance(key, str)
+                or not key.isidentifier()
+                or key.startswith("__")
+                or key == "_frozen_keys"
+                or hasattr(base, key)
+            ):
+                raise ValueError(f"{key!r} cannot be used as a FrozenNamespace attribute")
+        cls = type(
+            base.__name__,
+            (base,),
+            {"__slots__": keys, "_frozen_keys": keys, "__module__": base.__module__},
+        )
+        if len(_FROZEN_CLASSES) >= _MAX_FROZEN_CLASSES:
+            _FROZEN_CLASSES.clear()
+        _FROZEN_CLASSES[schema] = cls
+    return cls
+
+
+def _serialize_attrs(attrs: Dict[str, Any], recursive, kwargs) -> Dict[str, Any]:
+    """Serialize namespace attributes to a dictionary."""
+    # Start from a flat copy and replace only the values needing serialization
+    result = dict(attrs)
+    if not recursive:
+        return result
+
+    primitives = _PRIMITIVE_TYPES
+    traits_get = _TYPE_TRAITS.get
+    namespace_serialize = Namespace.serialize
+    for key, value in attrs.items():
+        if type(value) in primitives:
+            continue
+        traits = traits_get(type(value)) or _resolve_traits(value)
+        if traits & _HAS_SERIALIZE:
+            if type(value).serialize is namespace_serialize:
+                result[key] = _serialize_attrs(value.__dict__, recursive, kwargs)
+            else:
+                result[key] = value.serialize(recursive=recursive, **kwargs)
+        elif traits & _IS_DICT:
+            # Convert nested dicts to the proper serialized format
+            result[key] = {
+                k: v.serialize(**kwargs) if _has_ser(v) else v for k, v in value.items()
+            }
+        elif traits & _IS_LIST:
+            # Handle lists of serializable objects
+            result[key] = _serialize_list(value, kwargs)
+    return result
+
+
+def _build_from_dict(data: Dict[str, Any], make: Callable):
+    """Convert data and its nested dicts (also inside lists) with make(attrs).
+
+    Nested dicts are walked with an explicit stack rather than recursion so
+    that deep payloads are not bound by the interpreter recursion limit. Each
+    frame holds a dict, its remaining items once entered, the converted values
+    so far and the container/key where the finished namespace is stored.
+    """
+    root = [None]
+    path = set()  # ids of the dicts being converted, to detect cycles
+    stack = [[data, None, {}, root, 0]]
+    while stack:
+        frame = stack[-1]
+        source, items, processed, target, slot = frame
+        if items is None:
+            # Entered only when on top, so path holds no pending siblings
+            if id(source) in path:
+                raise RecursionError("from_dict data contains a reference cycle")
+            path.add(id(source))
+            frame[1] = items = iter(source.items())
+        for key, value in items:
+            # Exact type checks first; isinstance() only for other types
+            value_type = type(value)
+            if value_type in _PRIMITIVE_TYPES:
+                processed[key] = value
+            elif value_type is dict or isinstance(value, dict):
+                # Convert nested dicts before continuing
+                stack.append([value, None, {}, processed, key])
+                break
+            elif value_type is list or isinstance(value, list):
+                # Handle lists that might contain dicts
+                processed[key] = converted = list(value)
+                children = [
+                    [item, None, {}, converted, index]
+                    for index, item in enumerate(value)
+                    if type(item) is dict or isinstance(item, dict)
+                ]
+                if children:
+                    stack.extend(children)
+                    break
+            else:
+                processed[key] = value
+        else:
+            stack.pop()
+            path.discard(id(source))
+            target[slot] = make(processed)
+    return root[0]
+
+
+_STR_TYPES = frozenset({str})
+
+
+def _check_keys(attrs: Dict[str, Any]):
+    """Reject keys that cannot be attribute names, as cls(**attrs) would."""
+    if not _STR_TYPES.issuperset(map(type, attrs)):
+        for key in attrs:
+            if not isinstance(key, str):
+                raise TypeError("keywords must be strings")
+
+
+def _fill_from_dict(cls: type, data: Dict[str, Any]):
+    """Convert data to cls instances top-down, writing into each __dict__.
+
+    A faster form of _build_from_dict for namespaces that need no __init__:
+    instances are created before their contents, so every dict is visited
+    once with no per-node constructor call or intermediate dict. Data nested
+    deeper than the recursion limit, possibly a reference cycle, is handed to
+    _build_from_dict instead.
+    """
+    new = cls.__new__
+    primitives = _PRIMITIVE_TYPES
+    max_depth = sys.getrecursionlimit()
+    root = new(cls)
+    stack = [(root.__dict__, data, 0)]
+    while stack:
+        attrs, source, depth = stack.pop()
+        if depth > max_depth:
+            return _build_from_dict(data, cls._from_attrs)
+        depth += 1
+        for key, value in source.items():
+            if type(key) is not str:
+                _check_keys(source)
+            # Exact type checks first; isinstance() only for other types
+            value_type = type(value)
+            if value_type in primitives:
+                attrs[key] = value
+            elif value_type is dict or isinstance(value, dict):
+                attrs[key] = child = new(cls)
+                stack.append((child.__dict__, value, depth))
+            elif value_type is list or isinstance(value, list):
+                # Handle lists that might contain dicts
+                attrs[key] = converted = list(value)
+                for index, item in enumerate(converted):
+                    if type(item) is dict or isinstance(item, dict):
+                        converted[index] = child = new(cls)
+                        stack.append((child.__dict__, item, depth))
+            else:
+                attrs[key] = value
+    return root
+
+
+def _encode_serializable(obj):
+    return obj.serialize()
+
+
+def _encode_namespace(obj):
+    return obj.__dict__
+
+
+def _encode_dataclass(obj):
+    return {f.name: getattr(obj, f.name) for f in _dc_fields(obj)}
+
+
+def _encode_array(obj):
+    return obj.tolist()
+
+
+# type -> handler converting its instances to JSON-native values
+_DISPATCH: Dict[type, Callable] = {
+    Namespace: _encode_serializable,
+    SimpleNamespace: _encode_namespace,
+}
+
+
+def _resolve_encoder(obj):
+    """Find the encoder handler for obj and cache it by type, or return None."""
+    if _has_ser(obj):
+        handler = _encode_serializable
+    elif isinstance(obj, SimpleNamespace):
+        handler = _encode_namespace
+    elif _is_dc(obj) and not isinstance(obj, type):
+        handler = _encode_dataclass
+    elif callable(getattr(obj, "tolist", None)):
+        # NumPy arrays and scalars, array.array: converted in a single C call
+        handler = _encode_array
+    else:
+        return None
+    if not isinstance(obj, type):
+        if len(_DISPATCH) >= _MAX_CACHED_TYPES:
+            _DISPATCH.clear()
+        _DISPATCH[type(obj)] = handler
+    return handler
+
+
+def _serialization_default(obj):
+    """JSON ``default`` hook converting serialization objects to native values.
+
+    Works with both json.dumps and orjson.dumps.
+    """
+    handler = _DISPATCH.get(type(obj)) or _resolve_encoder(obj)
+    if handler is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return handler(obj)
+
+
+# json.dumps accepting serialization objects
+dumps = partial(json.dumps, default=_serialization_default)
+
+
 class SerializationEncoder(json.JSONEncoder):
-    """JSON encoder that handles serialization objects."""
+    """JSON encoder that handles serialization objects.
+
+    Kept for ``json.dumps(..., cls=SerializationEncoder)`` callers; dumps()
+    is the faster equivalent.
+    """
 
     def default(self, obj):
-        if hasattr(obj, "serialize"):
-            return obj.serialize()
-        elif isinstance(obj, SimpleNamespace):
-            return obj.__dict__
-        elif is_dataclass(obj):
-            return {f.name: getattr(obj, f.name) for f in fields(obj)}
-        return super().default(obj)
+        return _serialization_default(obj)
+
+
+if orjson is not None:
+    # Route dataclasses through the default hook so serializers keep control of
+    # their output, and datetimes so they are rejected as by the stdlib encoder;
+    # accept non-str keys the same way the stdlib encoder does, and let orjson
+    # write NumPy arrays natively
+    _ORJSON_OPTIONS = (
+        orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_SERIALIZE_NUMPY
+    )
+
+
+def _dumps(obj, indent=None) -> str:
+    """Encode obj as JSON, with orjson when installed and the indent allows.
+
+    orjson writes NaN and Infinity as null. Values it rejects (integers
+    beyond 64 bits, very deep nesting) are encoded by the stdlib encoder
+    in the same layout instead.
+    """
+    if orjson is not None and indent in (None, 2):
+        option = _ORJSON_OPTIONS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(
+                obj, default=_serialization_default, option=option
+            ).decode()
+        except orjson.JSONEncodeError:
+            return _dumps_fallback(obj, indent)
+    return dumps(obj, indent=indent)
+
+
+def _dumps_fallback(obj, indent=None) -> str:
+    """Encode obj with the stdlib encoder in the orjson output layout."""
+    separators = (",", ":") if indent is None else None
+    return dumps(obj, indent=indent, separators=separators, ensure_ascii=False)
+
+
+def _orjson_shallow_default(obj):
+    """orjson ``default`` hook serializing DataclassSerializers one level deep."""
+    if getattr(type(obj), "serialize", None) is DataclassSerializer.serialize:
+        result = obj.serialize(nested=False)
+        for key, value in result.items():
+            # Plain dataclass fields drop None values, as in nested serialize()
+            if _is_dc(value) and not _has_ser(value) and not isinstance(value, type):
+                result[key] = _serialize_nested(value, {})
+        return result
+    return _serialization_default(obj)
 
 
 # Utility functions
 def serialize_object(obj: Any, **kwargs) -> Dict[str, Any]:
     """Serialize any object using appropriate method."""
-    if hasattr(obj, "serialize"):
+    traits = _TYPE_TRAITS.get(type(obj)) or _resolve_traits(obj)
+    if traits & _HAS_SERIALIZE:
         return obj.serialize(**kwargs)
-    elif is_dataclass(obj):
+    elif traits & _IS_DATACLASS and not isinstance(obj, type):
         # Convert dataclass to dict
         return {
-            f.name: getattr(obj, f.name)
-            for f in fields(obj)
-            if getattr(obj, f.name) is not None
+            f.name: v for f in _dc_fields(obj) if (v := getattr(obj, f.name)) is not None
         }
     elif isinstance(obj, SimpleNamespace):
         return obj.__dict__
-    elif hasattr(obj, "__dict__"):
+    elif traits & _HAS_DICT:
         return {
             k: v
             for k, v in obj.__dict__.items()
-            if not k.startswith("_") and not callable(v) and v is not None
+            if v is not None and not k.startswith("_") and not callable(v)
         }
     else:
         return {"value": obj}
@@ -336,27 +1147,31 @@ def to_namespace(data: Dict[str, Any], recursive=True) -> Namespace:
 def _default_select(kk, vv, **kw):
     return (
         not kk.startswith("_")
+        and (kk != "id" or kw.get("with_id", True))
         and not callable(vv)
-        and (kw.get("with_id", True) or kk != "id")
     )
 
 
 def serialize(obj, flatten=True, with_id=False, select=None):
-    """Legacy serialize function for backward compatibility."""
+    """Legacy serialize function for backward compatibility.
+
+    Returns an iterator over the selected attributes as (key, value) pairs.
+    """
     if select is None:
         select = _default_select
+    return iter(_serialize_into({}, obj, flatten, with_id, select).items())
+
 
+def _serialize_into(out, obj, flatten, with_id, select) -> Dict[str, Any]:
+    """Write the selected attributes of obj into out, recursing into objects."""
+    traits_get = _TYPE_TRAITS.get
     for k, v in obj.__dict__.items():
         if select(k, v, with_id=with_id):
-            if hasattr(v, "__dict__") or hasattr(v, "__slots__"):
+            if (traits_get(type(v)) or _resolve_traits(v)) & (_HAS_DICT | _HAS_SLOTS):
                 if flatten:
-                    yield from serialize(
-                        v, flatten=flatten, with_id=with_id, select=select
-                    )
+                    _serialize_into(out, v, flatten, with_id, select)
                 else:
-                    yield (
-                        k,
-                        dict(serialize(v, flatten=False, with_id=with_id, select=select)),
-                    )
+                    out[k] = _serialize_into({}, v, False, with_id, select)
             else:
-                yield k, v
+                out[k] = v
+    return out
@@ -3,20 +3,29 @@
 Tests for the unified serialization module.
 """
 
+import array
+import enum
+import gc
 import pytest
 import json
-from dataclasses import dataclass, field
+import sys
+import weakref
+from datetime import datetime
+from dataclasses import dataclass, field, make_dataclass
 from typing import List, Optional
 
 from serialization import (
     DataclassSerializer,
     ObjectSerializer,
     Namespace,
+    FrozenNamespace,
     SerializationEncoder,
     serialize_object,
     to_namespace,
-    serialize
+    serialize,
+    dumps,
 )
+from serialization import serialization as serialization_module
 
 
 # Test DataclassSerializer
@@ -167,6 +176,19 @@ class TestDataclassSerializer:
         assert result["title"] == "Test"
         assert isinstance(result["nested"], NestedDataclass)
 
+    def test_subclass_configuration(self):
+        """Test subclasses serialize with their own configuration."""
+        @dataclass
+        class RenamedDataclass(TestDataclass):
+            _field_map = {"email": "mail"}
+
+        base = TestDataclass(name="john", age=30, email="john@example.com")
+        renamed = RenamedDataclass(name="jane", age=25, email="jane@example.com")
+
+        assert base.serialize()["email_address"] == "john@example.com"
+        assert renamed.serialize() == {"name": "JANE", "mail": "jane@example.com", "tags": []}
+        assert base.serialize()["email_address"] == "john@example.com"
+
     def test_default_values(self):
         """Test default values for missing fields."""
         obj = TestDataclass(name="john", age=30)  # No email
@@ -190,6 +212,98 @@ class TestDataclassSerializer:
         parsed = json.loads(result_json)
         assert parsed["name"] == "JOHN"
 
+    def test_non_str_field_map_keys(self):
+        """Test _field_map values that are not plain strings."""
+        class Key(enum.Enum):
+            NAME = "name"
+
+        @dataclass
+        class MappedDataclass(DataclassSerializer):
+            name: str
+            age: int
+            _field_map = {"name": Key.NAME, "age": 1}
+
+        assert MappedDataclass(name="john", age=30).serialize() == {Key.NAME: "john", 1: 30}
+
+    def test_static_and_class_method_transformers(self):
+        """Test value_of_* transformers declared as static or class methods."""
+        @dataclass
+        class StaticTransformer(DataclassSerializer):
+            name: str
+
+            @staticmethod
+            def value_of_name(value):
+                return value.upper()
+
+        @dataclass
+        class ClassTransformer(DataclassSerializer):
+            name: str
+            suffix = "!"
+
+            @classmethod
+            def value_of_name(cls, value):
+                return value + cls.suffix
+
+        assert StaticTransformer(name="john").serialize() == {"name": "JOHN"}
+        assert StaticTransformer(name="john")._get_field_value("name") == "JOHN"
+        assert ClassTransformer(name="john").serialize() == {"name": "john!"}
+        assert ClassTransformer(name="john")._get_field_value("name") == "john!"
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots needs 3.10")
+    def test_slotted_dataclass(self):
+        """Test slotted dataclass subclasses keep transformers without a __dict__."""
+        @dataclass(slots=True)
+        class SlottedDataclass(DataclassSerializer):
+            name: str
+
+            def value_of_name(self, value):
+                return value.upper()
+
+        obj = SlottedDataclass(name="john")
+        assert not hasattr(obj, "__dict__")
+        assert obj.serialize() == {"name": "JOHN"}
+        assert obj._get_field_value("name") == "JOHN"
+
+    def test_serialize_many(self):
+        """Test batch serialization matches per-object serialization."""
+        objs = [
+            TestDataclass(name="john", age=30, email="john@example.com"),
+            TestDataclass(name="jane", age=25),
+        ]
+        assert TestDataclass.serialize_many(objs) == [obj.serialize() for obj in objs]
+        assert TestDataclass.serialize_many(iter(objs)) == [obj.serialize() for obj in objs]
+
+        parent = ParentDataclass(title="Test", nested=NestedDataclass(id=1, data="test"))
+        mixed = DataclassSerializer.serialize_many([objs[0], parent], nested=False)
+        assert mixed == [objs[0].serialize(), parent.serialize(nested=False)]
+
+    def test_to_json_fast(self):
+        """Test single pass JSON output matches to_json()."""
+        obj = TestDataclass(name="john", age=30, email="john@example.com", tags=["dev"])
+        parent = ParentDataclass(title="Test", nested=NestedDataclass(id=1, data="test"))
+
+        @dataclass
+        class Plain:
+            id: int
+            note: Optional[str] = None
+
+        @dataclass
+        class Holder(DataclassSerializer):
+            title: str
+            plain: Plain
+            plains: List[Plain] = field(default_factory=list)
+            values: Optional[array.array] = None
+
+        holder = Holder("x", Plain(1), [Plain(2), Plain(3, "n")], array.array("i", [1, 2]))
+
+        big = Holder("x", Plain(2**70, "n"))
+        nullable = Holder("nullable é", Plain(4))
+
+        for item in (obj, parent, holder, big, nullable):
+            result_json = item.to_json_fast()
+            assert isinstance(result_json, str)
+            assert result_json == item.to_json()
+
 
 class TestObjectSerializer:
     """Test ObjectSerializer functionality."""
@@ -225,6 +339,14 @@ class TestObjectSerializer:
         assert "_private" not in result  # Private fields excluded
         assert "none_field" not in result  # None fields excluded
 
+    def test_default_like_options(self):
+        """Test arguments equal to the defaults serialize as the defaults do."""
+        obj = self.ParentObject()
+        expected = {"Title": "parent", "Nested_name": "nested", "Nested_value": 100}
+        assert obj.serialize() == expected
+        assert obj.serialize(flatten=1, with_class=0, capital=1) == expected
+        assert obj.serialize(with_class=1)["Parentobject1Title"] == "parent"
+
     def test_without_id(self):
         """Test serialization excluding id fields."""
         obj = self.TestObject()
@@ -257,6 +379,16 @@ class TestObjectSerializer:
         assert result["Testobject_Name"] == "test"
         assert result["Testobject_Value"] == 42
 
+    def test_with_class_prefix_subclass(self):
+        """Test class prefixes follow the instance class across repeated calls."""
+        class Derived(self.TestObject):
+            pass
+
+        assert self.TestObject().serialize(with_class=True)["Testobject_Name"] == "test"
+        assert Derived().serialize(with_class=True)["Derived_Name"] == "test"
+        assert self.TestObject().serialize(with_class="-")["Testobject-Name"] == "test"
+        assert self.TestObject().serialize(with_class=True)["Testobject_Name"] == "test"
+
     def test_class_name_case_transformations(self):
         """Test case transformations for class names."""
         obj = self.TestObject()
@@ -307,6 +439,15 @@ class TestObjectSerializer:
         result = obj.serialize(select_fn=custom_select)
         assert result == {"Name": "test"}  # Only 'name' field starts with 'n' and is not None
 
+    def test_overridden_default_select(self):
+        """Test a subclass can override the default selection."""
+        class NoValueObject(self.TestObject):
+            def _default_select(self, key, value, with_id=True):
+                return key != "value" and super()._default_select(key, value, with_id)
+
+        result = NoValueObject().serialize()
+        assert result == {"Name": "test", "Id": 123}
+
     def test_field_prefix(self):
         """Test field prefix functionality."""
         obj = self.TestObject()
@@ -356,6 +497,108 @@ class TestObjectSerializer:
         # Test slotted object handling (line 163)
         assert result["Slot_obj"] == "SlottedObject(slot_data)"
 
+    def test_serialize_many(self):
+        """Test batch serialization with shared options."""
+        objs = [self.TestObject(), self.TestObject()]
+        result = ObjectSerializer.serialize_many(objs, with_id=False, case="upper")
+        assert result == [{"NAME": "test", "VALUE": 42}] * 2
+
+    def test_nested_options(self):
+        """Test nested objects only receive flatten and extra arguments."""
+
+        class Child(ObjectSerializer):
+            def __init__(self):
+                self.id = 7
+                self.name = "child"
+
+        class Custom(ObjectSerializer):
+            def serialize(self, flatten=True, **kwargs):
+                return {"custom": kwargs}
+
+        class Parent(ObjectSerializer):
+            def __init__(self):
+                self.child = Child()
+                self.other = Custom()
+
+        result = Parent().serialize(case="upper", field_prefix="p", marker=1)
+        assert result == {"p_Id": 7, "p_Name": "child", "p_custom": {"marker": 1}}
+
+        result = Parent().serialize(flatten=False, with_id=False)
+        assert result == {"Child": {"Id": 7, "Name": "child"}, "Other": {"custom": {}}}
+
+    def test_unhashable_options(self):
+        """Test options that cannot be hashed are still accepted."""
+
+        class Selector:
+            __hash__ = None
+
+            def __call__(self, key, value, with_id=True):
+                return key == "name"
+
+        class Separator(list):
+            def __str__(self):
+                return "-"
+
+        obj = self.TestObject()
+        assert obj.serialize(select_fn=Selector()) == {"Name": "test"}
+        assert obj.serialize(with_class=Separator("-"))["Testobject-Name"] == "test"
+        assert obj.serialize(with_class=Separator()) == obj.serialize()
+        assert obj._format_key("name", with_class=Separator("-")) == "Testobject-Name"
+
+    def test_nested_options_on_demand(self):
+        """Test options for nested objects are built on first use only."""
+        options = serialization_module.SerializeOptions(select_fn=callable, extra={"x": 1})
+        assert options._nested is None
+        nested = options.nested
+        assert nested is options.nested
+        assert nested.select_fn is None and nested.extra == {"x": 1}
+        default = serialization_module.SerializeOptions()
+        assert default.nested is default
+
+    def test_cache_bounds(self):
+        """Test per-class caches stay bounded with dynamic attributes."""
+        max_layouts = serialization_module._MAX_CACHED_LAYOUTS
+        max_labels = serialization_module._MAX_CACHED_LABELS
+
+        class Bag(ObjectSerializer):
+            pass
+
+        for index in range(max_labels + 100):
+            bag = Bag()
+            setattr(bag, f"attr{index}", index)
+            assert bag.serialize() == {f"Attr{index}": index}
+
+        assert len(Bag._attr_cache) == max_layouts
+        assert all(len(labels) == max_labels for labels in Bag._label_cache.values())
+
+    def test_flatten_deeply_nested(self):
+        """Test flattening several levels keeps key order and prefixes."""
+
+        class Node(ObjectSerializer):
+            def __init__(self, depth):
+                setattr(self, f"before{depth}", depth)
+                if depth < 3:
+                    self.child = Node(depth + 1)
+                setattr(self, f"after{depth}", depth)
+
+        result = Node(0).serialize(field_prefix="n")
+        assert list(result) == [
+            "n_Before0",
+            "n_Before1",
+            "n_Before2",
+            "n_Before3",
+            "n_After3",
+            "n_After2",
+            "n_After1",
+            "n_After0",
+        ]
+
+        # Cycles still fail instead of looping
+        first, second = Node(3), Node(3)
+        first.child, second.child = second, first
+        with pytest.raises(RecursionError):
+            first.serialize()
+
     def test_label_method(self):
         """Test the label method of ObjectSerializer."""
         obj = self.TestObject()
@@ -404,6 +647,19 @@ class TestNamespace:
         assert isinstance(ns.nested, dict)
         assert ns.nested["a"] == 1
 
+    def test_from_dict_non_str_keys(self):
+        """Test from_dict rejects keys that cannot be attribute names."""
+        for data in ({1: 2}, {"a": {1: 2}}, {"a": [{None: 1}]}):
+            with pytest.raises(TypeError, match="keywords must be strings"):
+                Namespace.from_dict(data)
+        with pytest.raises(TypeError, match="keywords must be strings"):
+            Namespace.from_dict({1: 2}, recursive=False)
+
+        class Key(str):
+            pass
+
+        assert Namespace.from_dict({Key("a"): {Key("b"): 1}}).a.b == 1
+
     def test_update(self):
         """Test namespace update method."""
         ns = Namespace(name="test")
@@ -447,6 +703,35 @@ class TestNamespace:
         assert result["nested"]["key1"]["Value"] == "test_value"
         assert result["nested"]["key2"] == "value2"
 
+    def test_list_serialization(self):
+        """Test serialization of homogeneous and mixed lists in Namespace."""
+        ns = Namespace(
+            objects=[Namespace(a=1), Namespace(a=2)],
+            mixed=[Namespace(a=1), "plain", 3],
+            values=[1, 2, 3],
+            empty=[],
+        )
+
+        result = ns.serialize()
+        assert result["objects"] == [{"a": 1}, {"a": 2}]
+        assert result["mixed"] == [{"a": 1}, "plain", 3]
+        assert result["values"] == [1, 2, 3]
+        assert result["values"] is not ns.values
+        assert result["empty"] == []
+
+    def test_list_serialization_options(self):
+        """Test namespaces in lists receive the caller's serialize() options."""
+
+        @dataclass
+        class Holder(DataclassSerializer):
+            items: list
+
+        inner = Namespace(b=1)
+        obj = ObjectSerializer()
+        holder = Holder(items=[Namespace(o=obj, inner=inner)])
+        assert holder.serialize(recursive=False) == {"items": [{"o": obj, "inner": inner}]}
+        assert holder.serialize() == {"items": [{"o": {}, "inner": {"b": 1}}]}
+
     def test_from_dict_with_list_of_dicts(self):
         """Test from_dict with list containing dictionaries."""
         # Create a dictionary with a list of dictionaries
@@ -471,6 +756,53 @@ class TestNamespace:
         assert ns.items[1].id == 2
         assert ns.items[1].value == "two"
 
+    def test_from_dict_subclass_init(self):
+        """Test from_dict constructs subclasses with a custom __init__ normally."""
+        class Config(Namespace):
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+                self.loaded = True
+
+        ns = Config.from_dict({"name": "test", "nested": {"a": 1}})
+        assert isinstance(ns.nested, Config)
+        assert ns.loaded and ns.nested.loaded
+        assert Config.from_dict({"a": 1}, recursive=False).loaded
+
+    def test_from_dict_deeply_nested(self):
+        """Test from_dict handles nesting deeper than the recursion limit."""
+        data = leaf = {}
+        for _ in range(sys.getrecursionlimit() + 100):
+            leaf["child"] = {}
+            leaf = leaf["child"]
+        leaf["value"] = 42
+
+        ns = Namespace.from_dict(data)
+        for _ in range(sys.getrecursionlimit() + 100):
+            ns = ns.child
+        assert ns.value == 42
+
+    def test_weakref(self):
+        """Test namespaces can be weakly referenced."""
+        ns = Namespace(a=1)
+        assert weakref.ref(ns)() is ns
+
+    def test_from_dict_reference_cycle(self):
+        """Test from_dict rejects self-referencing data but accepts shared dicts."""
+        class InitNamespace(Namespace):
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+
+        cyclic = {"name": "loop"}
+        cyclic["self"] = cyclic
+        shared = {"x": 1}
+        for cls in (Namespace, InitNamespace, FrozenNamespace):
+            with pytest.raises(RecursionError):
+                cls.from_dict(cyclic)
+            with pytest.raises(RecursionError):
+                cls.from_dict({"items": [cyclic]})
+            ns = cls.from_dict({"a": shared, "b": [shared, shared]})
+            assert ns.a.x == 1 and [item.x for item in ns.b] == [1, 1]
+
     def test_json_serialization(self):
         """Test JSON serialization."""
         ns = Namespace(name="test", value=42)
@@ -480,6 +812,104 @@ class TestNamespace:
         assert parsed["name"] == "test"
         assert parsed["value"] == 42
 
+    def test_json_serialization_indent(self):
+        """Test JSON output is the same regardless of indentation backend."""
+        ns = Namespace(name="test", inner=Namespace(a=1), items=[Namespace(b=2)])
+        expected = {"name": "test", "inner": {"a": 1}, "items": [{"b": 2}]}
+
+        assert json.loads(ns.to_json()) == expected
+        assert json.loads(ns.to_json(indent=2)) == expected
+        assert json.loads(ns.to_json(indent=4)) == expected
+        assert "\n    " in ns.to_json(indent=4)
+
+    def test_json_serialization_stdlib_fallback(self, monkeypatch):
+        """Test to_json encodes what orjson rejects, with or without orjson."""
+        deep = Namespace(value=1)
+        for _ in range(300):
+            deep = Namespace(child=deep)
+        ns = Namespace(big=2**70, missing=None, inner=Namespace(a=1))
+
+        for backend in (serialization_module.orjson, None):
+            monkeypatch.setattr(serialization_module, "orjson", backend)
+            assert json.loads(ns.to_json()) == {"big": 2**70, "missing": None, "inner": {"a": 1}}
+            assert json.loads(deep.to_json()) == json.loads(deep.to_json(indent=4))
+            if backend is not None:
+                # The fallback keeps the orjson layout
+                assert Namespace(a="é", b=None).to_json() == '{"a":"é","b":null}'
+                big = Namespace(a="é", big=2**70).to_json()
+                assert big == '{"a":"é","big":%d}' % 2**70
+                assert Namespace(x=float("nan")).to_json() == '{"x":null}'
+            else:
+                assert "NaN" in Namespace(x=float("nan")).to_json()
+                assert "Infinity" in Namespace(x=float("inf")).to_json(indent=2)
+            with pytest.raises(TypeError, match="not JSON serializable"):
+                Namespace(t=datetime(2020, 1, 1)).to_json()
+
+
+class TestFrozenNamespace:
+    """Test FrozenNamespace functionality."""
+
+    def test_basic_creation(self):
+        """Test basic frozen namespace creation."""
+        ns = FrozenNamespace(name="test", value=42)
+        assert ns.name == "test"
+        assert ns.value == 42
+        assert not hasattr(ns, "__dict__")
+        assert type(ns) is type(FrozenNamespace(name="other", value=0))
+
+    def test_from_dict(self):
+        """Test creating frozen namespace from dictionary."""
+        data = {"name": "test", "nested": {"a": 1}, "items": [{"id": 1}, 2]}
+        ns = FrozenNamespace.from_dict(data)
+
+        assert isinstance(ns.nested, FrozenNamespace)
+        assert ns.nested.a == 1
+        assert isinstance(ns.items[0], FrozenNamespace)
+        assert ns.items[0].id == 1
+        assert ns.serialize() == data
+        assert json.loads(ns.to_json()) == data
+
+    def test_fixed_attributes(self):
+        """Test attributes can be updated but not added."""
+        ns = FrozenNamespace(name="test")
+        ns.update(name="changed")
+        assert ns.get("name") == "changed"
+        assert ns.get("missing", "default") == "default"
+
+        with pytest.raises(AttributeError):
+            ns.update(value=42)
+
+    def test_invalid_keys(self):
+        """Test keys that cannot be slots are rejected."""
+        with pytest.raises(ValueError, match="cannot be used as a FrozenNamespace attribute"):
+            FrozenNamespace.from_dict({"not valid": 1})
+
+        with pytest.raises(ValueError, match="data must be a dictionary"):
+            FrozenNamespace.from_dict("not a dict")
+
+        for key in ("serialize", "to_dict", "get", "_attrs", "_frozen_keys"):
+            with pytest.raises(ValueError, match="cannot be used as a FrozenNamespace"):
+                FrozenNamespace(**{key: 1})
+
+    def test_class_cache(self):
+        """Test generated classes are shared by key set and the cache is bounded."""
+        ns = FrozenNamespace(a=1, b=2)
+        assert type(FrozenNamespace.from_dict({"b": 3, "a": 4})) is type(ns)
+
+        max_classes = serialization_module._MAX_FROZEN_CLASSES
+        for index in range(max_classes + 10):
+            FrozenNamespace.from_dict({f"key_{index}": index})
+        assert len(serialization_module._FROZEN_CLASSES) <= max_classes
+
+    def test_equality_and_pickle(self):
+        """Test equality, repr and pickling."""
+        import pickle
+
+        ns = FrozenNamespace.from_dict({"name": "test", "nested": {"a": 1}})
+        assert ns == FrozenNamespace(name="test", nested=FrozenNamespace(a=1))
+        assert repr(ns) == "FrozenNamespace(name='test', nested=FrozenNamespace(a=1))"
+        assert pickle.loads(pickle.dumps(ns)) == ns
+
 
 class TestSerializationEncoder:
     """Test SerializationEncoder functionality."""
@@ -519,6 +949,15 @@ class TestSerializationEncoder:
         assert parsed["name"] == "test"
         assert parsed["value"] == 42
 
+    def test_encode_dataclass_class(self):
+        """Test a dataclass class is not encoded as an instance."""
+        @dataclass
+        class TestDC:
+            name: str
+
+        with pytest.raises(TypeError, match="not JSON serializable"):
+            json.dumps({"cls": TestDC}, cls=SerializationEncoder)
+
     def test_encode_simple_namespace(self):
         """Test encoding SimpleNamespace objects."""
         from types import SimpleNamespace
@@ -531,6 +970,27 @@ class TestSerializationEncoder:
         assert parsed["name"] == "test"
         assert parsed["value"] == 42
 
+    def test_encode_array(self):
+        """Test encoding array objects via tolist()."""
+        from array import array
+
+        data = {"values": array("i", [1, 2, 3])}
+        assert json.loads(json.dumps(data, cls=SerializationEncoder)) == {"values": [1, 2, 3]}
+        assert json.loads(Namespace(**data).to_json()) == {"values": [1, 2, 3]}
+
+    def test_dumps(self):
+        """Test dumps handles serialization objects without an encoder class."""
+        @dataclass
+        class TestDC:
+            name: str
+
+        data = {"ns": Namespace(name="test"), "dc": TestDC(name="dc")}
+        assert json.loads(dumps(data)) == {"ns": {"name": "test"}, "dc": {"name": "dc"}}
+        assert dumps(data, indent=2) == json.dumps(data, cls=SerializationEncoder, indent=2)
+
+        with pytest.raises(TypeError):
+            dumps(object())
+
     def test_encoder_fallback(self):
         """Test the fallback in SerializationEncoder.default."""
         # Create an object that doesn't have any of the special handling
@@ -572,6 +1032,15 @@ class TestUtilityFunctions:
         assert result["name"] == "test"
         assert result["value"] == 42
 
+    def test_serialize_object_dataclass_class(self):
+        """Test serialize_object with a dataclass class rather than an instance."""
+        @dataclass
+        class TestDC:
+            name: str
+            value: int = 42
+
+        assert serialize_object(TestDC) == {"value": 42}
+
     def test_serialize_object_regular_object(self):
         """Test serialize_object with regular object."""
         class TestObj:
@@ -628,6 +1097,18 @@ class TestUtilityFunctions:
         assert result["value"] == 42
         assert "_private" not in result
 
+    def test_legacy_serialize_pairs(self):
+        """Test legacy serialize function still yields (key, value) pairs."""
+        class TestObj:
+            def __init__(self):
+                self.name = "test"
+                self.value = 42
+
+        assert list(serialize(TestObj())) == [("name", "test"), ("value", 42)]
+        pairs = serialize(TestObj())
+        assert next(pairs) == ("name", "test")
+        assert list(pairs) == [("value", 42)]
+
     def test_legacy_serialize_with_id_false(self):
         """Test legacy serialize function with with_id=False."""
         class TestObj:
@@ -715,3 +1196,25 @@ class TestEdgeCases:
 
         assert result["Name"] == "test"
         assert "empty" not in result
+
+    def test_type_caches_bounded(self):
+        """Test per-type caches do not keep dynamically created classes alive."""
+        first = make_dataclass("Dynamic", [("x", int)])
+        first_ref = weakref.ref(first)
+        dumps(first(1))
+        del first
+
+        max_types = serialization_module._MAX_CACHED_TYPES
+        for index in range(max_types + 10):
+            cls = make_dataclass(f"Dynamic{index}", [("x", int)])
+            assert json.loads(dumps(cls(index))) == {"x": index}
+            assert serialize_object(cls(index)) == {"x": index}
+        del cls
+        for cache in (
+            serialization_module._TYPE_TRAITS,
+            serialization_module._DC_FIELDS_CACHE,
+            serialization_module._DISPATCH,
+        ):
+            assert len(cache) <= max_types
+        gc.collect()
+        assert first_ref() is None